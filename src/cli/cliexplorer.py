@@ -1,10 +1,141 @@
-import subprocess
+import asyncio
 import re
 import json
+import os
+import shlex
+import shutil
+import hashlib
+import time
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import argparse
 
+try:
+    import re2 as _re2  # Optional: linear-time engine from google-re2
+except ImportError:
+    _re2 = None
+
+def _compile(pattern: bytes, flags: int = 0):
+    """Compile through re2 when it is installed and supports the pattern.
+
+    re2 matches in linear time regardless of pattern structure, which rules
+    out any backtracking blow-up while scanning untrusted help pages.
+    Patterns using constructs it lacks (e.g. lookahead) silently fall back
+    to the stdlib engine, as does an environment without re2.
+
+    re2.compile takes an re2.Options object rather than stdlib flag ints,
+    so the flags re2 can express are translated to inline (?im) groups and
+    anything else falls back to the stdlib engine.
+    """
+    # Named groups stay on the stdlib engine: the re2 wrapper indexes a
+    # bytes pattern's group names as bytes, so match.group('name') at the
+    # call sites would raise under re2.
+    if (_re2 is not None and b'(?P<' not in pattern
+            and not flags & ~(re.IGNORECASE | re.MULTILINE)):
+        inline = b''
+        if flags & re.IGNORECASE:
+            inline += b'i'
+        if flags & re.MULTILINE:
+            inline += b'm'
+        options = _re2.Options()
+        options.log_errors = False  # Rejected patterns are expected; no absl spam
+        try:
+            return _re2.compile(
+                b'(?' + inline + b')' + pattern if inline else pattern, options)
+        except Exception:
+            # re2.error for unsupported constructs, but be defensive about
+            # wrapper API differences too -- a fallback must never crash
+            pass
+    return re.compile(pattern, flags)
+
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'cli-mcp')
+# How long a failed or timed-out help lookup stays cached; long enough to
+# spare repeat explorations the wait, short enough to retry a transient
+# failure within the hour.
+_NEGATIVE_TTL = 3600
+# Longest single line of help output a pool worker will buffer.
+_STREAM_LIMIT = 1024 * 1024
+
+# Pre-compiled patterns for help-text parsing.  Compiling once at import time
+# avoids re.compile cache lookups (and re-parses on cache misses) on every
+# help page explored, which adds up over large command trees.
+#
+# The patterns are written to be linear in the input: descriptions are matched
+# as a first line plus explicit continuation lines (`[^\n]*` segments joined
+# by `\n`) rather than a multi-line `.+?` with a lookahead, which can
+# backtrack quadratically on pathological help pages.
+# The patterns are compiled in bytes mode and applied directly to raw
+# subprocess stdout, so a help page is never decoded wholesale; only the
+# small matched fields that end up in Parameter/Command objects are.
+# Description body: rest of the line, plus continuation lines that are
+# neither blank nor the start of another option.
+_DESC = rb'[^\n]*(?:\n(?! *-|\n)[^\n]*)*'
+# Git-style parameter patterns: [-v | --version] [-C <path>] etc.
+_USAGE_PARAM_RE = _compile(
+    rb'\[(?:-([a-zA-Z])\s*\|?\s*)?(?:--([a-zA-Z0-9-]+))(?:(?:[=\s])?(?:<([^>]+)>))?\]')
+# The option-description styles are fused into one alternation so the help
+# text is scanned once instead of once per style.  The old "simple" style
+# (GNU without the uppercase type word) is subsumed by the GNU alternative,
+# whose type group is optional.
+_ALL_PARAMS_RE = _compile(
+    # GNU style: --param-name, -p PARAM description
+    rb'(?:(?P<gnu_short>-[a-zA-Z]),\s+)?(?P<gnu_long>--[a-zA-Z0-9-]+)'
+    rb'(?:\s+(?P<gnu_type>[A-Z_]+))?\s+(?P<gnu_desc>' + _DESC + rb')'
+    # Git style options section.  The lookahead keeps this branch from
+    # firing on specs that continue with a long form (`-o FILE, --output
+    # FILE  ...`): matching there would swallow the line and hide the
+    # --output option from the GNU branch.
+    rb'|^\s+(?P<git_name>-[a-zA-Z]|\-\-[a-zA-Z0-9-]+)'
+    rb'(?!(?:\s*[A-Z_]+|\s*<[^>]+>)?,\s*--)'
+    rb'(?:\s*[=\s]\s*<(?P<git_type>[^>]+)>)?\s+(?P<git_desc>' + _DESC + rb')',
+    re.MULTILINE)
+# Required/default/choices are pulled out of an option description in a
+# single case-insensitive scan rather than a .lower() copy plus separate
+# searches per fact.
+_META_RE = _compile(
+    rb'\b(?P<req>required|mandatory)\b'
+    rb'|default[: ]+(?P<def>[^)\n]+)'
+    rb'|(?:choices|options)[: ]+\{(?P<ch>[^}]+)\}',
+    re.IGNORECASE)
+_SECTION_PATTERNS = [_compile(p, re.IGNORECASE) for p in (
+    rb'(?:Commands|Subcommands):\n((?:\s+\w+.*\n)+)',
+    rb'available\s+commands:\n((?:\s+\w+.*\n)+)',
+)]
+_CMD_NAME_RE = _compile(rb'\s+(\w+)[:\s]')
+# Plausible subcommand names; filters out flag descriptions and prose the
+# loose section patterns sometimes capture, so we don't fork a process to
+# probe them.
+_SUBCMD_NAME_RE = _compile(rb'[a-z][a-z0-9_-]{0,40}\Z')
+
+# Help pages generated by the common CLI frameworks have rigid two-column
+# layouts, so once the framework is recognized the sections can be parsed
+# deterministically with string splits instead of the generic regexes.
+# These are the exact (lowercased) header lines that open each framework's
+# option and subcommand sections.
+_FRAMEWORK_OPTION_HEADERS = {
+    'argparse': (b'options:', b'optional arguments:'),
+    'click': (b'options:',),
+    'cobra': (b'flags:', b'global flags:', b'options:'),
+}
+_FRAMEWORK_COMMAND_HEADERS = {
+    'argparse': (b'positional arguments:', b'subcommands:', b'commands:'),
+    'click': (b'commands:',),
+    'cobra': (b'available commands:',),
+}
+
+def _detect_framework(help_text: bytes) -> str:
+    """Identify the framework that generated a help page, if recognizable."""
+    if b'Available Commands:' in help_text or b'\nFlags:\n' in help_text:
+        return 'cobra'
+    low = help_text.lower()
+    if b'positional arguments:' in low or b'optional arguments:' in low:
+        return 'argparse'
+    if help_text.startswith(b'usage:') and b'\noptions:\n' in low:
+        return 'argparse'  # 3.10+ renamed "optional arguments" to "options"
+    if help_text.startswith(b'Usage:') and b'\nOptions:\n' in help_text:
+        return 'click'
+    return 'unknown'
+
 @dataclass
 class Parameter:
     name: str
@@ -14,6 +145,18 @@ class Parameter:
     default: Optional[str] = None
     choices: Optional[List[str]] = None
 
+    def to_clean_dict(self) -> Dict:
+        """Convert to a dict for JSON output, dropping empty fields."""
+        d = {'name': self.name, 'description': self.description,
+             'required': self.required}
+        if self.type is not None:
+            d['type'] = self.type
+        if self.default is not None:
+            d['default'] = self.default
+        if self.choices:
+            d['choices'] = self.choices
+        return d
+
 @dataclass
 class Command:
     name: str
@@ -21,55 +164,299 @@ class Command:
     parameters: List[Parameter]
     subcommands: Dict[str, 'Command']
 
+    def to_clean_dict(self) -> Dict:
+        """Convert to a dict for JSON output, dropping empty fields."""
+        d = {'name': self.name, 'description': self.description}
+        if self.parameters:
+            d['parameters'] = [p.to_clean_dict() for p in self.parameters]
+        if self.subcommands:
+            d['subcommands'] = {name: cmd.to_clean_dict()
+                                for name, cmd in self.subcommands.items()}
+        return d
+
+class _HelpCache:
+    """Disk cache for help-command output under ~/.cache/cli-mcp/.
+
+    Entries are keyed by the full argv and invalidated when the mtime of the
+    underlying binary changes, so re-exploring a tool is served from disk
+    until the tool itself is upgraded.
+    """
+
+    def __init__(self, cache_dir: str = _CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_path(self, command_parts) -> str:
+        digest = hashlib.sha1(' '.join(command_parts).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f'{digest}.json')
+
+    @staticmethod
+    def _binary_mtime(command_parts) -> Optional[float]:
+        path = shutil.which(command_parts[0])
+        try:
+            return os.stat(path).st_mtime if path else None
+        except OSError:
+            return None
+
+    def get(self, command_parts) -> Optional[bytes]:
+        try:
+            with open(self._entry_path(command_parts)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('mtime') != self._binary_mtime(command_parts):
+            return None
+        if 'failed_at' in entry:
+            if time.time() - entry['failed_at'] < _NEGATIVE_TTL:
+                return b""
+            return None  # Negative entry expired; let the caller retry
+        return entry['output'].encode('utf-8')
+
+    def put(self, command_parts, output: bytes):
+        entry = {
+            'command': ' '.join(command_parts),
+            'mtime': self._binary_mtime(command_parts),
+        }
+        if output:
+            # Entries are stored as JSON text; the parser works on bytes
+            entry['output'] = output.decode('utf-8', 'replace')
+        else:
+            # A command with no help output burned a full timeout getting
+            # here; remember that so the next exploration doesn't re-pay it
+            entry['failed_at'] = time.time()
+        try:
+            with open(self._entry_path(command_parts), 'w') as f:
+                json.dump(entry, f)
+        except OSError:
+            pass  # Cache is best-effort; exploration still works without it
+
+class _ShellPool:
+    """Pool of long-lived bash workers that serve help invocations.
+
+    Help for tools like git is often printed via wrapper scripts, so a
+    subprocess.run per node can fork several binaries; feeding the
+    invocations to a few persistent shells amortizes that startup cost
+    across the hundreds of calls a deep command tree generates.
+    """
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = size or (os.cpu_count() or 1)
+        self._idle: Optional[asyncio.Queue] = None
+        self._request_count = 0
+
+    async def _checkout(self):
+        """Borrow an idle worker, (re)spawning its shell if needed."""
+        if self._idle is None:
+            # Created lazily so the queue binds to the running event loop
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                self._idle.put_nowait(None)
+        worker = await self._idle.get()
+        if worker is None or worker.returncode is not None:
+            worker = await asyncio.create_subprocess_exec(
+                'bash',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                # readline raises ValueError past the stream limit; asyncio's
+                # 64 KiB default is smaller than real single-line help output
+                limit=_STREAM_LIMIT,
+            )
+            # Reusable stdout accumulator; grown on demand and kept for the
+            # worker's lifetime so each help page doesn't allocate a fresh
+            # chunk list plus joined copy.
+            worker.help_buf = bytearray(65536)
+        return worker
+
+    async def run(self, command_parts: List[str], timeout: float = 2) -> bytes:
+        """Run `cmd --help` (falling back to `cmd -h`) on a pooled shell."""
+        worker = await self._checkout()
+        self._request_count += 1
+        sentinel = f'__CLI_MCP_DONE_{self._request_count}__'.encode()
+        quoted = ' '.join(shlex.quote(part) for part in command_parts)
+        # `env` keeps shell builtins (true, echo, ...) from shadowing the
+        # external binary the explorer is actually asking about.
+        script = (
+            f'__out=$(env {quoted} --help 2>/dev/null)'
+            f' || __out=$(env {quoted} -h 2>/dev/null); '
+            f'printf \'%s\' "$__out"; printf \'\\n{sentinel.decode()}\\n\'\n'
+        )
+        try:
+            worker.stdin.write(script.encode())
+            await worker.stdin.drain()
+            output = await asyncio.wait_for(
+                self._read_until(worker, sentinel), timeout)
+        except BaseException:
+            # A timed-out (or otherwise wedged) worker may still be printing;
+            # kill it and leave a placeholder so a fresh shell replaces it.
+            try:
+                worker.kill()
+            except ProcessLookupError:
+                pass
+            self._idle.put_nowait(None)
+            raise
+        self._idle.put_nowait(worker)
+        return output if output.strip() else b""
+
+    async def close(self) -> None:
+        """Terminate every idle worker and reset the pool.
+
+        Without this the shells linger until the pool is garbage collected;
+        a later run() lazily rebuilds the pool, so close() is safe to call
+        between explorations.
+        """
+        if self._idle is None:
+            return
+        idle, self._idle = self._idle, None
+        while not idle.empty():
+            worker = idle.get_nowait()
+            if worker is None:
+                continue
+            try:
+                worker.kill()
+            except ProcessLookupError:
+                pass
+            await worker.wait()
+
+    @staticmethod
+    async def _read_until(worker, sentinel: bytes) -> bytes:
+        # Output accumulates into the worker's persistent buffer; only the
+        # final bytes() handed to the caller is a fresh allocation (it has
+        # to be, since the buffer is reused by the worker's next request).
+        buf = worker.help_buf
+        n = 0
+        while True:
+            line = await worker.stdout.readline()
+            if not line or line.rstrip() == sentinel:
+                break
+            end = n + len(line)
+            if end > len(buf):
+                buf.extend(b'\0' * max(len(buf), len(line)))
+            buf[n:end] = line
+            n = end
+        return bytes(memoryview(buf)[:n])
+
 class CLIExplorer:
     def __init__(self, base_command: str):
         """Initialize the CLI explorer with the base command to analyze."""
         self.base_command = base_command
-        self.visited_commands = set()  # Track visited commands to avoid cycles
+        self._help_cache = _HelpCache()
+        # Per-instance memo so repeat lookups within one exploration don't
+        # even touch the disk cache.
+        self._session_cache: Dict[tuple, bytes] = {}
+        # Bound concurrent help requests so a wide command tree doesn't
+        # pile every pending invocation onto the pool at once.
+        self._subprocess_sem = asyncio.Semaphore((os.cpu_count() or 1) * 4)
+        self._pool = _ShellPool()
+
+    async def _execute_help_command(self, command_parts: List[str]) -> bytes:
+        """Return help output for a command, using the caches when possible."""
+        key = tuple(command_parts)
+        if key in self._session_cache:
+            return self._session_cache[key]
+        output = await self._run_help_command(key)
+        self._session_cache[key] = output
+        return output
 
-    def _execute_help_command(self, command_parts: List[str]) -> str:
+    async def _run_help_command(self, command_parts) -> bytes:
         """Execute a help command and return its output."""
-        try:
-            # Try with --help first
-            result = subprocess.run(
-                command_parts + ["--help"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return result.stdout
-            
-            # Fall back to -h if --help fails
-            result = subprocess.run(
-                command_parts + ["-h"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.stdout
-        except subprocess.TimeoutExpired:
-            print(f"Command timed out: {' '.join(command_parts)}")
-            return ""
-        except subprocess.SubprocessError as e:
-            print(f"Error executing command {' '.join(command_parts)}: {e}")
-            return ""
-
-    def _parse_parameters(self, help_text: str) -> List[Parameter]:
-        """Parse parameters from help text output."""
+        cached = self._help_cache.get(command_parts)
+        if cached is not None:
+            return cached
+        output = await self._spawn_help_command(list(command_parts))
+        self._help_cache.put(command_parts, output)
+        return output
+
+    async def _spawn_help_command(self, command_parts: List[str]) -> bytes:
+        """Ask a pooled shell for the command's help output."""
+        async with self._subprocess_sem:
+            try:
+                return await self._pool.run(command_parts)
+            except asyncio.TimeoutError:
+                print(f"Command timed out: {' '.join(command_parts)}")
+                return b""
+            except ValueError:
+                # readline overran the stream limit: a pathological help page
+                # emitted a single line longer than _STREAM_LIMIT.  Treat it
+                # like any other unusable output instead of aborting the walk.
+                print(f"Oversized help output from: {' '.join(command_parts)}")
+                return b""
+            except OSError as e:
+                print(f"Error executing command {' '.join(command_parts)}: {e}")
+                return b""
+
+    def _parse_parameters(self, help_text: bytes) -> List[Parameter]:
+        """Parse parameters from raw help output."""
         parameters = []
-        
-        # First try to parse usage pattern for git-style commands
-        usage_match = re.search(r'usage:.*?\n((?:.*\n)*?)(?:\n|$)', help_text, re.IGNORECASE)
-        if usage_match:
-            usage_lines = usage_match.group(1).strip().split('\n')
-            for line in usage_lines:
-                # Parse git-style parameter patterns: [-v | --version] [-C <path>] etc.
-                param_matches = re.finditer(r'\[(?:-([a-zA-Z])\s*\|?\s*)?(?:--([a-zA-Z0-9-]+))(?:(?:[=\s])?(?:<([^>]+)>))?\]', line)
+        seen = set()  # Normalized names already emitted, for O(1) dedup
+
+        # Parse the detailed option descriptions first, in one scan over the
+        # text: when an option shows up both here and in the usage line, the
+        # entry with the real description must win the dedup, not the
+        # "Option from usage pattern" stub.
+        for match in _ALL_PARAMS_RE.finditer(help_text):
+            long_name = match.group('gnu_long')
+            if long_name is not None:  # GNU style, with optional type
+                raw_name = long_name
+                param_type = match.group('gnu_type')
+                description = match.group('gnu_desc')
+            else:  # Git style options section
+                raw_name = match.group('git_name')
+                param_type = match.group('git_type')
+                description = match.group('git_desc')
+
+            # Clean up parameter name
+            name = raw_name.lstrip(b'-').decode('utf-8', 'replace')
+            if name in seen:
+                continue
+            seen.add(name)
+
+            # Parse required/default/choices from the description in one pass
+            required = False
+            default = None
+            choices = None
+            for meta in _META_RE.finditer(description):
+                if meta.group('req'):
+                    required = True
+                elif meta.group('def') and default is None:
+                    default = meta.group('def').decode('utf-8', 'replace')
+                elif meta.group('ch') and choices is None:
+                    choices = [c.strip().decode('utf-8', 'replace')
+                               for c in meta.group('ch').split(b',')]
+
+            param = Parameter(
+                name=name,
+                description=description.strip().decode('utf-8', 'replace'),
+                type=(param_type.decode('utf-8', 'replace')
+                      if param_type is not None else None),
+                required=required,
+                default=default,
+                choices=choices
+            )
+            parameters.append(param)
+
+        # Then pick up options that only appear in a git-style usage block.
+        # The block is located with plain string operations (find + split on
+        # the first blank line) instead of a multi-line regex, so parsing
+        # stays linear regardless of how long or oddly-shaped the help
+        # output is.
+        usage_idx = help_text.lower().find(b'usage:')
+        if usage_idx != -1:
+            usage_block = help_text[usage_idx:].split(b'\n\n', 1)[0]
+            for line in usage_block.splitlines():
+                param_matches = _USAGE_PARAM_RE.finditer(line)
                 for match in param_matches:
-                    short_opt, long_opt, param_type = match.groups()
-                    name = long_opt or short_opt
+                    # Individual group lookups skip the tuple match.groups()
+                    # would allocate for every option in every usage line
+                    name = match.group(2) or match.group(1)
+                    param_type = match.group(3)
                     if name:
+                        name = name.decode('utf-8', 'replace')
+                        if name in seen:
+                            continue
+                        seen.add(name)
+                        if param_type is not None:
+                            param_type = param_type.decode('utf-8', 'replace')
                         parameters.append(Parameter(
                             name=name,
                             description=f"Option from usage pattern{f' (takes {param_type})' if param_type else ''}",
@@ -77,166 +464,246 @@ class CLIExplorer:
                             required=False
                         ))
 
-        # Then parse detailed option descriptions
-        # Common patterns for argument descriptions
-        param_patterns = [
-            # GNU style: --param-name, -p PARAM description
-            r'(?:(-[a-zA-Z]),\s+)?(--[a-zA-Z0-9-]+)(?:\s+([A-Z_]+))?\s+(.+?)(?=(?:\n\s+(?:-|$)|\n\n|\Z))',
-            # Simple style: -p, --param-name description
-            r'(?:(-[a-zA-Z]),\s+)?(--[a-zA-Z0-9-]+)\s+(.+?)(?=(?:\n\s+(?:-|$)|\n\n|\Z))',
-            # Git style options section
-            r'^\s+(-[a-zA-Z]|\-\-[a-zA-Z0-9-]+)(?:\s*[=\s]\s*<([^>]+)>)?\s+(.+?)(?=\n\s+(?:-|$)|\n\n|\Z)',
-        ]
-
-        for pattern in param_patterns:
-            matches = re.finditer(pattern, help_text, re.MULTILINE)
-            for match in matches:
-                groups = match.groups()
-                
-                if len(groups) == 4:  # GNU style with type
-                    short_name, long_name, param_type, description = groups
-                elif len(groups) == 3:  # Simple style
-                    short_name, long_name, description = groups
-                    param_type = None
-                else:
-                    continue
-
-                # Clean up parameter name
-                name = (long_name or short_name).lstrip('-')
-                
-                # Parse additional metadata from description
-                required = any(word in description.lower() 
-                             for word in ['required', 'mandatory'])
-                
-                # Look for default values
-                default_match = re.search(r'default[: ]+([^)\n]+)', 
-                                        description, re.IGNORECASE)
-                default = default_match.group(1) if default_match else None
-
-                # Look for choices
-                choices_match = re.search(r'(?:choices|options)[: ]+\{([^}]+)\}', 
-                                       description, re.IGNORECASE)
-                choices = [c.strip() for c in choices_match.group(1).split(',')
-                          ] if choices_match else None
-
-                param = Parameter(
-                    name=name,
-                    description=description.strip(),
-                    type=param_type,
-                    required=required,
-                    default=default,
-                    choices=choices
-                )
-                parameters.append(param)
-
         return parameters
 
-    def _extract_subcommands(self, help_text: str) -> List[str]:
-        """Extract subcommands from help text output."""
+    def _extract_subcommands(self, help_text: bytes) -> List[str]:
+        """Extract subcommands from raw help output."""
         subcommands = []
-        
-        # Common patterns for subcommand sections
-        section_patterns = [
-            r'(?:Commands|Subcommands):\n((?:\s+\w+.*\n)+)',
-            r'available\s+commands:\n((?:\s+\w+.*\n)+)',
-        ]
-
-        for pattern in section_patterns:
-            section_match = re.search(pattern, help_text, re.IGNORECASE)
+
+        for pattern in _SECTION_PATTERNS:
+            section_match = pattern.search(help_text)
             if section_match:
                 section = section_match.group(1)
                 # Extract command names from the section
-                command_matches = re.finditer(r'\s+(\w+)[:\s]', section)
-                subcommands.extend(match.group(1) for match in command_matches)
+                command_matches = _CMD_NAME_RE.finditer(section)
+                subcommands.extend(match.group(1).decode('utf-8', 'replace')
+                                   for match in command_matches
+                                   if _SUBCMD_NAME_RE.match(match.group(1)))
 
         return subcommands
 
-    def explore_command(self, command_parts: List[str]) -> Command:
+    @staticmethod
+    def _iter_section_lines(help_text: bytes, headers):
+        """Yield the indented lines of each section opened by `headers`.
+
+        A section header is an unindented line (e.g. b'Options:'); the
+        section runs over the indented lines that follow it and ends at the
+        next unindented line.
+        """
+        in_section = False
+        for line in help_text.splitlines():
+            if line[:1] not in (b' ', b'\t'):
+                in_section = line.strip().lower() in headers
+                continue
+            if in_section and line.strip():
+                yield line
+
+    def _parse_framework_options(self, help_text: bytes, headers) -> List[Parameter]:
+        """Parse a framework's rigid two-column options section.
+
+        Option lines look like `-f, --format FMT  description`; deeper
+        indented lines without a leading dash continue the description.
         """
-        Recursively explore a command and its subcommands.
-        
+        parameters = []
+        seen = set()
+        current = None  # (name, type, description parts) being accumulated
+
+        def flush():
+            if current is None:
+                return
+            name, param_type, desc_parts = current
+            if not name or name in seen:
+                return
+            seen.add(name)
+            description = b' '.join(desc_parts).strip()
+            required = False
+            default = None
+            choices = None
+            for meta in _META_RE.finditer(description):
+                if meta.group('req'):
+                    required = True
+                elif meta.group('def') and default is None:
+                    default = meta.group('def').decode('utf-8', 'replace')
+                elif meta.group('ch') and choices is None:
+                    choices = [c.strip().decode('utf-8', 'replace')
+                               for c in meta.group('ch').split(b',')]
+            parameters.append(Parameter(
+                name=name.decode('utf-8', 'replace'),
+                description=description.decode('utf-8', 'replace'),
+                type=(param_type.decode('utf-8', 'replace')
+                      if param_type else None),
+                required=required,
+                default=default,
+                choices=choices,
+            ))
+
+        for line in self._iter_section_lines(help_text, headers):
+            stripped = line.strip()
+            if not stripped.startswith(b'-'):
+                if current is not None:
+                    current[2].append(stripped)
+                continue
+            flush()
+            spec, _, rest = stripped.partition(b'  ')
+            name = None
+            param_type = None
+            for flag in spec.split(b','):
+                flag = flag.strip()
+                if b'=' in flag:
+                    flag, _, value = flag.partition(b'=')
+                else:
+                    flag, _, value = flag.partition(b' ')
+                if value.strip():
+                    param_type = value.strip().strip(b'<>')
+                # Prefer the long name when both spellings are given
+                if flag.startswith(b'--') or name is None:
+                    name = flag.lstrip(b'-')
+            current = (name, param_type, [rest.strip()])
+        flush()
+
+        return parameters
+
+    def _parse_framework_commands(self, help_text: bytes, headers,
+                                  braces_only: bool = False) -> List[str]:
+        """Read subcommand names from a framework's two-column section.
+
+        With braces_only (argparse), only `{add,remove,list}` subparser
+        choice lines count, so plain positional arguments aren't mistaken
+        for subcommands.
+        """
+        names = []
+        for line in self._iter_section_lines(help_text, headers):
+            first = line.split(None, 1)[0]
+            if first.startswith(b'{'):
+                # argparse subparser choices: {add,remove,list}
+                for name in first.strip(b'{}').split(b','):
+                    if _SUBCMD_NAME_RE.match(name):
+                        names.append(name.decode('utf-8', 'replace'))
+            elif not braces_only and _SUBCMD_NAME_RE.match(first):
+                names.append(first.decode('utf-8', 'replace'))
+        return names
+
+    def _parse_description(self, help_text: bytes) -> str:
+        """Extract a command description, looking beyond the usage block."""
+        description = b""
+        paragraphs = help_text.split(b'\n\n')
+
+        # Skip usage paragraphs and find the first real description
+        for para in paragraphs:
+            para = para.strip()
+            # Skip usage patterns, empty lines, and common non-description sections
+            if (not para.lower().startswith(b'usage:') and
+                not para.lower().startswith(b'these are common git commands') and
+                not all(c in b'-=_' for c in para) and  # Skip separator lines
+                len(para) > 0):
+                description = para
+                break
+
+        if not description:
+            # Fallback to first non-empty paragraph if no clear description found
+            description = next((p.strip() for p in paragraphs if p.strip()), b"")
+
+        return description.decode('utf-8', 'replace')
+
+    async def explore_command(self, command_parts: List[str],
+                              ancestors: frozenset = frozenset()) -> Command:
+        """
+        Explore a command and its subcommands level-synchronously.
+
+        The tree is walked breadth-first: the help invocations for a whole
+        level are launched together (throttled by the shell pool), then
+        parsed, then the next level is launched.  Batching the executions
+        keeps the kernel's process-creation pipeline full instead of paying
+        one round-trip per node.
+
         Args:
             command_parts: List of command parts (e.g., ['git', 'remote', 'add'])
-            
+            ancestors: Command identifiers on the path from the root to here
+
         Returns:
             Command object representing the command structure
         """
-        # Create command identifier for cycle detection
-        command_id = ' '.join(command_parts)
-        if command_id in self.visited_commands:
+        # Tuples of the existing part strings hash without the allocation a
+        # ' '.join identity string would cost on every node.
+        command_id = tuple(command_parts)
+        if command_id in ancestors:
             return Command(
                 name=command_parts[-1],
                 description="[Circular reference]",
                 parameters=[],
                 subcommands={}
             )
-        
-        self.visited_commands.add(command_id)
-        
-        # Get help text for current command
-        help_text = self._execute_help_command(command_parts)
-        if not help_text:
-            return Command(
-                name=command_parts[-1],
-                description="[No help text available]",
-                parameters=[],
-                subcommands={}
-            )
 
-        # Extract command description, looking for a proper description beyond usage
-        description = ""
-        paragraphs = help_text.split('\n\n')
-        
-        # Skip usage paragraphs and find the first real description
-        for para in paragraphs:
-            para = para.strip()
-            # Skip usage patterns, empty lines, and common non-description sections
-            if (not para.lower().startswith('usage:') and 
-                not para.lower().startswith('these are common git commands') and
-                not all(c in '-=_' for c in para) and  # Skip separator lines
-                len(para) > 0):
-                description = para
-                break
-        
-        if not description:
-            # Fallback to first non-empty paragraph if no clear description found
-            description = next((p.strip() for p in paragraphs if p.strip()), "")
-        
-        # Parse parameters
-        parameters = self._parse_parameters(help_text)
-        
-        # Get subcommands
-        subcommands_list = self._extract_subcommands(help_text)
-        
-        # Recursively explore subcommands
-        subcommands = {}
-        for subcmd in subcommands_list:
-            new_command_parts = command_parts + [subcmd]
-            subcommands[subcmd] = self.explore_command(new_command_parts)
-            
-        return Command(
-            name=command_parts[-1],
-            description=description,
-            parameters=parameters,
-            subcommands=subcommands
-        )
+        root = Command(name=command_parts[-1], description="",
+                       parameters=[], subcommands={})
+        frontier = [(command_parts, ancestors, root)]
+
+        while frontier:
+            help_texts = await asyncio.gather(
+                *(self._execute_help_command(parts)
+                  for parts, _, _ in frontier))
+
+            next_frontier = []
+            for (parts, node_ancestors, node), help_text in zip(frontier, help_texts):
+                if not help_text:
+                    node.description = "[No help text available]"
+                    continue
+
+                node.description = self._parse_description(help_text)
+
+                # Recognized frameworks get their rigid sections parsed
+                # deterministically; everything else goes through the
+                # generic regex pipeline.
+                framework = _detect_framework(help_text)
+                if framework in _FRAMEWORK_OPTION_HEADERS:
+                    node.parameters = self._parse_framework_options(
+                        help_text, _FRAMEWORK_OPTION_HEADERS[framework])
+                else:
+                    node.parameters = self._parse_parameters(help_text)
 
-    def generate_schema(self) -> Dict:
+                low = help_text.lower()
+                if framework in _FRAMEWORK_COMMAND_HEADERS:
+                    subcommands_list = self._parse_framework_commands(
+                        help_text, _FRAMEWORK_COMMAND_HEADERS[framework],
+                        braces_only=(framework == 'argparse'))
+                elif (b'commands:' in low or b'subcommands:' in low
+                        or b'available commands' in low):
+                    # A cheap substring check first: if the help text has no
+                    # subcommand section marker at all, skip the section
+                    # parse (and the shell invocations behind it) outright
+                    # -- most leaf commands bail here.
+                    subcommands_list = self._extract_subcommands(help_text)
+                else:
+                    subcommands_list = []
+
+                # Queue subcommands for the next level.  A command is only a
+                # cycle if its literal path repeats an ancestor; subcommand
+                # names legitimately recur under different parents (e.g.
+                # `git remote add` vs `git submodule add`), so a tree-wide
+                # visited set would wrongly prune those branches.
+                node_id = tuple(parts)
+                child_ancestors = node_ancestors | {node_id}
+                for subcmd in dict.fromkeys(subcommands_list):
+                    child = Command(name=subcmd, description="",
+                                    parameters=[], subcommands={})
+                    node.subcommands[subcmd] = child
+                    if (*node_id, subcmd) in child_ancestors:
+                        child.description = "[Circular reference]"
+                        continue
+                    next_frontier.append((parts + [subcmd], child_ancestors, child))
+
+            frontier = next_frontier
+
+        return root
+
+    async def generate_schema(self) -> Dict:
         """Generate a complete schema for the CLI command."""
-        command_structure = self.explore_command([self.base_command])
-        
-        # Convert to dictionary and clean up for JSON output
-        def _clean_dict(d):
-            if isinstance(d, (Command, Parameter)):
-                d = asdict(d)
-            if isinstance(d, dict):
-                return {k: _clean_dict(v) for k, v in d.items() 
-                        if v is not None and v != [] and v != {}}
-            if isinstance(d, list):
-                return [_clean_dict(i) for i in d]
-            return d
-            
-        return _clean_dict(command_structure)
+        try:
+            command_structure = await self.explore_command([self.base_command])
+        finally:
+            # Don't leave the pool's shells running until garbage collection
+            await self._pool.close()
+        return command_structure.to_clean_dict()
 
 def main():
     parser = argparse.ArgumentParser(
@@ -246,7 +713,7 @@ def main():
     args = parser.parse_args()
 
     explorer = CLIExplorer(args.command)
-    schema = explorer.generate_schema()
+    schema = asyncio.run(explorer.generate_schema())
     
     if args.output:
         with open(args.output, 'w') as f:
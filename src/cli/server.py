@@ -1,4 +1,5 @@
 import asyncio
+import json
 import sys
 from mcp.server.models import InitializationOptions
 import mcp.types as types
@@ -6,13 +7,36 @@ from mcp.server import NotificationOptions, Server
 from pydantic import AnyUrl
 import mcp.server.stdio
 from typing import Any
-# Store clis as a simple key-value dict to demonstrate state management
-clis: dict[str, str] = {}
 import logging
 import subprocess
+from .cliexplorer import CLIExplorer
 server = Server("cli")
 import os
 
+# Learned schemas are persisted next to the help cache so `add` across
+# server restarts is served from disk instead of re-exploring the tool.
+_CLIS_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'cli-mcp', 'clis.json')
+
+def _load_clis() -> dict[str, bytes]:
+    try:
+        with open(_CLIS_PATH) as f:
+            return {cmd: blob.encode() for cmd, blob in json.load(f).items()}
+    except (OSError, ValueError, AttributeError):
+        return {}  # Missing, corrupt, or pre-blob-format file: start fresh
+
+def _save_clis() -> None:
+    try:
+        os.makedirs(os.path.dirname(_CLIS_PATH), exist_ok=True)
+        with open(_CLIS_PATH, 'w') as f:
+            json.dump({cmd: blob.decode() for cmd, blob in clis.items()}, f)
+    except OSError:
+        pass  # Persistence is best-effort; in-memory state still works
+
+# Each schema is kept as a pre-serialized JSON blob, so serving a cached
+# add/help/read_resource is a decode of stored bytes rather than a repeat
+# stringification of the nested dict (which, via repr, wasn't even JSON).
+clis: dict[str, bytes] = _load_clis()
+
 @server.list_resources()
 async def handle_list_resources() -> list[types.Resource]:
     """
@@ -41,7 +65,7 @@ async def handle_read_resource(uri: AnyUrl) -> str:
     cli = uri.path
     if cli is not None:
         name = cli.lstrip("/")
-        return clis[cli]
+        return clis[name].decode()
     raise ValueError(f"cli not found: {cli}")
 
 #@server.list_prompts()
@@ -138,6 +162,32 @@ async def handle_list_tools() -> list[types.Tool]:
         )
     ]
 
+# One lock per command being explored, so concurrent add/help calls for the
+# same tool collapse into a single exploration instead of racing duplicate
+# subprocess walks.
+_explore_locks: dict[str, asyncio.Lock] = {}
+
+async def _ensure_schema(cmd: str) -> tuple[bytes, bool]:
+    """Return the JSON schema blob for cmd, exploring it on first use.
+
+    The second element of the returned pair is True when the schema was
+    freshly explored (i.e. the resource list changed).  Exploration is
+    fully async, so the event loop keeps serving other requests while a
+    command tree is being walked.
+    """
+    if cmd in clis:
+        return clis[cmd], False
+    lock = _explore_locks.setdefault(cmd, asyncio.Lock())
+    async with lock:
+        if cmd in clis:  # Explored while we waited on the lock
+            return clis[cmd], False
+        explorer = CLIExplorer(cmd)
+        schema = await explorer.generate_schema()
+        blob = json.dumps(schema).encode()
+        clis[cmd] = blob
+        _save_clis()
+    return blob, True
+
 @server.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
@@ -159,45 +209,16 @@ async def handle_call_tool(
         raise ValueError("Missing 'cmd' argument")
 
     # Update server state
-    if name == 'add':
-        if cmd in clis:
-            schema = clis[cmd]
-            return [types.TextContent(
-                type="text",
-                text=f"{schema}"
-                )]
-        else:
-            from .cliexplorer import CLIExplorer
-            explorer = CLIExplorer(cmd)
-            schema = explorer.generate_schema()
-            clis[cmd] = schema
+    if name in ('add', 'help'):
+        blob, explored = await _ensure_schema(cmd)
+        if explored:
             # Notify clients that resources have changed
             await server.request_context.session.send_resource_list_changed()
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"{schema}",
-                )]
-
-    elif name == 'help':
-        if cmd in clis:
-            schema = clis[cmd]
-            return [types.TextContent(
+        return [
+            types.TextContent(
                 type="text",
-                text=f"{schema}"
-                )]
-        else:
-            from .cliexplorer import CLIExplorer
-            explorer = CLIExplorer(cmd)
-            schema = explorer.generate_schema()
-            clis[cmd] = schema
-            # Notify clients that resources have changed
-            await server.request_context.session.send_resource_list_changed()
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"{schema}",
-                )]
+                text=blob.decode(),
+            )]
 
     elif name == 'run':
         if cmd not in clis: